@@ -2,31 +2,37 @@
 """Convert app icon to RGB format (remove transparency) for iOS requirements."""
 
 from PIL import Image
+import numpy as np
 import sys
 import os
 
 def convert_icon(input_path, output_path):
     """Convert icon to RGB format, removing transparency."""
     img = Image.open(input_path)
-    
+
     if img.mode == 'RGBA':
-        # Create white background and composite the image
-        bg = Image.new('RGB', img.size, (255, 255, 255))
-        bg.paste(img, mask=img.split()[3])  # Use alpha channel as mask
-        bg.save(output_path, 'PNG')
+        # Blend onto white in one vectorized pass over the (H, W, 3) buffer;
+        # PIL's split+paste route allocates four bands and composites per pixel
+        arr = np.asarray(img)
+        rgb = arr[..., :3].astype(np.float32)
+        a = arr[..., 3:4].astype(np.float32) * (1.0 / 255.0)
+        out = (rgb * a + 255.0 * (1.0 - a)).astype(np.uint8)
+        result = Image.fromarray(out, 'RGB')
         print(f"✓ Converted RGBA to RGB (removed transparency)")
     elif img.mode != 'RGB':
         # Convert other modes to RGB
-        img.convert('RGB').save(output_path, 'PNG')
+        result = img.convert('RGB')
         print(f"✓ Converted {img.mode} to RGB")
     else:
         # Already RGB, just copy
-        img.save(output_path, 'PNG')
+        result = img
         print(f"✓ Icon already in RGB format")
-    
-    # Verify output
-    output_img = Image.open(output_path)
-    print(f"✓ Output: {output_img.size[0]}x{output_img.size[1]}, Mode: {output_img.mode}")
+
+    result.save(output_path, 'PNG')
+
+    # Report from the in-memory image; re-opening the PNG just to print
+    # size/mode would decode the whole file again
+    print(f"✓ Output: {result.size[0]}x{result.size[1]}, Mode: {result.mode}")
 
 if __name__ == '__main__':
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -4,8 +4,8 @@
  * 
  * Tests without RC receiver - simulates throttle via serial commands
  * 
- * NOTE: High-pass filtering is applied OFFLINE using circular FFT 
- * in build/audio/make_engine_filtered_fft.py to guarantee click-free looping.
+ * NOTE: High-pass filtering is applied OFFLINE using circular FFT
+ * in audio-assets/engine/make_engine_filtered_fft.py to guarantee click-free looping.
  * 
  * Serial Commands:
  *   0-9: Set throttle 0-100% (0=idle, 9=full)
@@ -1,10 +1,45 @@
-import uuid
+import os
+import random
+import struct
 
 # Track instances to fix the "?" issue in KiCAD
 instances = []
 
+# Every wire/label/symbol line below consumes a UUID; the schematic needs on
+# the order of 100. Draw the entropy for a whole batch in one call and format
+# every v4 UUID up front in a tight loop — skipping both per-call entropy
+# syscalls and uuid.UUID's parse/validate constructor — so the hot formatting
+# path is just a list pop. These are internal KiCad object IDs, not security
+# tokens, so the Mersenne Twister is plenty and avoids getrandom entirely.
+#
+# Seeding from the title and revision makes every rerun reproduce the same
+# schematic byte for byte: rebuilds become no-ops (the unchanged-write check
+# below short-circuits) and VCS diffs only appear when something real moves.
+SCHEMATIC_TITLE = "Edmund Fitzgerald - MASTER SCHEMATIC"
+SCHEMATIC_REV = "6.0"
+_rng = random.Random(f"{SCHEMATIC_TITLE}-rev{SCHEMATIC_REV}")
+_UUID_BATCH = 256
+_uuids = []
+
+# One precompiled unpack plus a single %-format yields the canonical 36-char
+# form directly, instead of hex() followed by five substring slices.
+_UUID_STRUCT = struct.Struct('>IHHHHI')
+_UUID_FMT = '%08x-%04x-%04x-%04x-%04x%08x'
+
+def _make_uuids(n):
+    raw = _rng.randbytes(n * 16)
+    out = []
+    for i in range(0, n * 16, 16):
+        b = bytearray(raw[i:i + 16])
+        b[6] = (b[6] & 0x0F) | 0x40  # version 4
+        b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+        out.append(_UUID_FMT % _UUID_STRUCT.unpack(b))
+    return out
+
 def gen_uuid():
-    return str(uuid.uuid4())
+    if not _uuids:
+        _uuids.extend(_make_uuids(_UUID_BATCH))
+    return _uuids.pop()
 
 def add_instance(ref, unit, value, footprint, symb_uuid):
     instances.append({
@@ -15,11 +50,18 @@ def add_instance(ref, unit, value, footprint, symb_uuid):
         "uuid": symb_uuid
     })
 
+# Line templates hoisted to module constants. printf-style %-formatting on a
+# fixed template dispatches to C-level PyUnicode_Format, which beats both
+# f-string bytecode and str.format's spec parsing for these hot call sites.
+_LABEL_TPL = '  (label "%s" (at %s %s %s) (effects (font (size 1.27 1.27)) (justify left bottom)) (uuid "%s"))'
+_WIRE_TPL = '  (wire (pts (xy %s %s) (xy %s %s)) (stroke (width 0) (type solid)) (uuid "%s"))'
+_TEXT_TPL = '  (text "%s" (at %s %s 0) (effects (font (size %s %s))) (uuid "%s"))'
+
 def kicad_label(text, x, y, rot=0):
-    return f'  (label "{text}" (at {x} {y} {rot}) (effects (font (size 1.27 1.27)) (justify left bottom)) (uuid "{gen_uuid()}"))'
+    return _LABEL_TPL % (text, x, y, rot, gen_uuid())
 
 def kicad_wire(x1, y1, x2, y2):
-    return f'  (wire (pts (xy {x1} {y1}) (xy {x2} {y2})) (stroke (width 0) (type solid)) (uuid "{gen_uuid()}"))'
+    return _WIRE_TPL % (x1, y1, x2, y2, gen_uuid())
 
 def kicad_orthogonal_wire(x1, y1, x2, y2, mid_x):
     """Draws an L-shaped orthogonal wire from (x1,y1) to (x2,y2) via mid_x"""
@@ -30,17 +72,21 @@ def kicad_orthogonal_wire(x1, y1, x2, y2, mid_x):
     ]
 
 def kicad_text(text, x, y, size=1.5):
-    return f'  (text "{text}" (at {x} {y} 0) (effects (font (size {size} {size}))) (uuid "{gen_uuid()}"))'
+    return _TEXT_TPL % (text, x, y, size, size, gen_uuid())
 
 # --- SYMBOL DEFINITIONS ---
-symbols = """
+# One named module constant per part: builders reference a single allocation
+# apiece instead of one opaque multi-KB literal.
+RESISTOR_SYMBOL = """
   (symbol "Device:R" (pin_numbers hide) (pin_names (offset 0)) (in_bom yes) (on_board yes)
    (property "Reference" "R" (at 2.032 0 90)) (property "Value" "R" (at 0 0 90))
    (symbol "R_0_1" (rectangle (start -1.016 -2.54) (end 1.016 2.54) (stroke (width 0.254)) (fill (type none))))
    (symbol "R_1_1"
     (pin passive line (at 0 3.81 270) (length 1.27) (name "~" (effects (font (size 1.27 1.27)))) (number "1"))
     (pin passive line (at 0 -3.81 90) (length 1.27) (name "~" (effects (font (size 1.27 1.27)))) (number "2")))
-  )
+  )"""
+
+NMOS_SYMBOL = """
   (symbol "Transistor_FET:Q_NMOS_GDS" (pin_names (offset 0) hide) (in_bom yes) (on_board yes)
    (property "Reference" "Q" (at 5.08 2.54 0)) (property "Value" "Q_NMOS_GDS" (at 5.08 0 0))
    (symbol "Q_NMOS_GDS_0_1"
@@ -52,7 +98,9 @@ symbols = """
     (pin input line (at 0 0 0) (length 2.54) (name "G" (effects (font (size 1.27 1.27)))) (number "1"))
     (pin passive line (at 3.81 5.08 270) (length 2.54) (name "D" (effects (font (size 1.27 1.27)))) (number "2"))
     (pin passive line (at 3.81 -5.08 90) (length 2.54) (name "S" (effects (font (size 1.27 1.27)))) (number "3")))
-  )
+  )"""
+
+LED_SYMBOL = """
   (symbol "Device:LED" (pin_numbers hide) (pin_names (offset 1.016) hide) (in_bom yes) (on_board yes)
    (property "Reference" "D" (at 0 2.54 0)) (property "Value" "LED" (at 0 -2.54 0))
    (symbol "LED_0_1"
@@ -61,7 +109,9 @@ symbols = """
    (symbol "LED_1_1"
     (pin passive line (at -3.81 0 0) (length 2.54) (name "K" (effects (font (size 1.27 1.27)))) (number "1"))
     (pin passive line (at 3.81 0 180) (length 2.54) (name "A" (effects (font (size 1.27 1.27)))) (number "2")))
-  )
+  )"""
+
+ESP32_DEVKIT_SYMBOL = """
   (symbol "MCU_Espressif:ESP32-DevKit" (pin_names (offset 1.016)) (in_bom yes) (on_board yes)
    (property "Reference" "U" (at -12.7 22.86 0)) (property "Value" "ESP32-DevKit" (at 0 22.86 0))
    (symbol "ESP32-DevKit_0_1"
@@ -83,7 +133,9 @@ symbols = """
     (pin bidirectional line (at 15.24 -2.54 180) (length 2.54) (name "IO4" (effects (font (size 1.27 1.27)))) (number "26"))
     (pin bidirectional line (at 15.24 0 180) (length 2.54) (name "IO2" (effects (font (size 1.27 1.27)))) (number "24"))
     (pin bidirectional line (at 15.24 2.54 180) (length 2.54) (name "IO16" (effects (font (size 1.27 1.27)))) (number "25")))
-  )
+  )"""
+
+MAX98357A_SYMBOL = """
   (symbol "Module:MAX98357A" (in_bom yes) (on_board yes)
    (property "Reference" "U" (at 0 15.24 0)) (property "Value" "MAX98357A" (at 0 12.7 0))
    (symbol "MAX98357A_0_1" (rectangle (start -10.16 -12.7) (end 10.16 12.7) (stroke (width 0.254)) (fill (type background))))
@@ -95,7 +147,9 @@ symbols = """
     (pin input line (at -12.7 0 0) (length 2.54) (name "DIN" (effects (font (size 1.27 1.27)))) (number "5"))
     (pin output line (at 12.7 0 180) (length 2.54) (name "SPK+" (effects (font (size 1.27 1.27)))) (number "6"))
     (pin output line (at 12.7 -2.54 180) (length 2.54) (name "SPK-" (effects (font (size 1.27 1.27)))) (number "7")))
-  )
+  )"""
+
+DFPLAYER_SYMBOL = """
   (symbol "Module:DFPlayer_Pro" (in_bom yes) (on_board yes)
    (property "Reference" "U" (at 0 17.78 0)) (property "Value" "DFPlayer_Pro" (at 0 15.24 0))
    (symbol "DFPlayer_Pro_0_1" (rectangle (start -10.16 -15.24) (end 10.16 15.24) (stroke (width 0.254)) (fill (type background))))
@@ -106,7 +160,9 @@ symbols = """
     (pin output line (at -12.7 5.08 0) (length 2.54) (name "TX" (effects (font (size 1.27 1.27)))) (number "4"))
     (pin output line (at 12.7 12.7 180) (length 2.54) (name "L-OUT" (effects (font (size 1.27 1.27)))) (number "5"))
     (pin output line (at 12.7 10.16 180) (length 2.54) (name "R-OUT" (effects (font (size 1.27 1.27)))) (number "6")))
-  )
+  )"""
+
+ESP32_CAM_SYMBOL = """
   (symbol "Module:ESP32-CAM" (in_bom yes) (on_board yes)
    (property "Reference" "U" (at 0 15.24 0)) (property "Value" "ESP32-CAM" (at 0 12.7 0))
    (symbol "ESP32-CAM_0_1" (rectangle (start -10.16 -12.7) (end 10.16 12.7) (stroke (width 0.254)) (fill (type background))))
@@ -114,27 +170,35 @@ symbols = """
     (pin power_in line (at -12.7 10.16 0) (length 2.54) (name "5V" (effects (font (size 1.27 1.27)))) (number "1"))
     (pin power_in line (at -12.7 7.62 0) (length 2.54) (name "GND" (effects (font (size 1.27 1.27)))) (number "2"))
     (pin input line (at -12.7 5.08 0) (length 2.54) (name "U0R" (effects (font (size 1.27 1.27)))) (number "3"))
-    (pin output line (at -12.7 2.54 0) (length 2.54) (name "U0T" (effects (font (size 1.27 1.27)))) (number "4"))))
+    (pin output line (at -12.7 2.54 0) (length 2.54) (name "U0T" (effects (font (size 1.27 1.27)))) (number "4"))))"""
+
+CONN_1X03_SYMBOL = """
   (symbol "Connector:Conn_01x03_Male" (pin_names (offset 1.016) hide) (in_bom yes) (on_board yes)
    (property "Reference" "J" (at 0 5.08 0)) (property "Value" "RC_Pin" (at 0 -2.54 0))
    (symbol "Conn_01x03_Male_0_1" (rectangle (start -1.27 -1.27) (end 1.27 6.35) (stroke (width 0.254)) (fill (type none))))
    (symbol "Conn_01x03_Male_1_1"
     (pin passive line (at -5.08 5.08 0) (length 3.81) (name "1" (effects (font (size 1.27 1.27)))) (number "1"))
     (pin passive line (at -5.08 2.54 0) (length 3.81) (name "2" (effects (font (size 1.27 1.27)))) (number "2"))
-    (pin passive line (at -5.08 0 0) (length 3.81) (name "3" (effects (font (size 1.27 1.27)))) (number "3"))))
+    (pin passive line (at -5.08 0 0) (length 3.81) (name "3" (effects (font (size 1.27 1.27)))) (number "3"))))"""
+
+CONN_1X02_SYMBOL = """
   (symbol "Connector:Conn_01x02_Male" (pin_names (offset 1.016) hide) (in_bom yes) (on_board yes)
    (property "Reference" "J" (at 0 5.08 0)) (property "Value" "Battery_In" (at 0 -2.54 0))
    (symbol "Conn_01x02_Male_0_1" (rectangle (start -1.27 -1.27) (end 1.27 3.81) (stroke (width 0.254)) (fill (type none))))
    (symbol "Conn_01x02_Male_1_1"
     (pin passive line (at -5.08 2.54 0) (length 3.81) (name "1" (effects (font (size 1.27 1.27)))) (number "1"))
-    (pin passive line (at -5.08 0 0) (length 3.81) (name "2" (effects (font (size 1.27 1.27)))) (number "2"))))
+    (pin passive line (at -5.08 0 0) (length 3.81) (name "2" (effects (font (size 1.27 1.27)))) (number "2"))))"""
+
+SERVO_SYMBOL = """
   (symbol "Motor:Servo" (pin_names (offset 1.016) hide) (in_bom yes) (on_board yes)
    (property "Reference" "M" (at 0 5.08 0)) (property "Value" "Rudder_Servo" (at 0 -2.54 0))
    (symbol "Servo_0_1" (rectangle (start -2.54 -2.54) (end 2.54 5.08) (stroke (width 0.254)) (fill (type none))))
    (symbol "Servo_1_1"
     (pin input line (at -5.08 2.54 0) (length 2.54) (name "PWM" (effects (font (size 1.27 1.27)))) (number "1"))
     (pin power_in line (at -5.08 0 0) (length 2.54) (name "VCC" (effects (font (size 1.27 1.27)))) (number "2"))
-    (pin power_in line (at -5.08 -2.54 0) (length 2.54) (name "GND" (effects (font (size 1.27 1.27)))) (number "3"))))
+    (pin power_in line (at -5.08 -2.54 0) (length 2.54) (name "GND" (effects (font (size 1.27 1.27)))) (number "3"))))"""
+
+UBEC_SYMBOL = """
   (symbol "Converter_DCDC:UBEC_5V" (in_bom yes) (on_board yes)
    (property "Reference" "U" (at 0 10.16 0)) (property "Value" "UBEC_5V" (at 0 7.62 0))
    (symbol "UBEC_5V_0_1" (rectangle (start -10.16 -7.62) (end 10.16 7.62) (stroke (width 0.254)) (fill (type background))))
@@ -145,130 +209,188 @@ symbols = """
     (pin power_out line (at 12.7 -5.08 180) (length 2.54) (name "GND_OUT" (effects (font (size 1.27 1.27)))) (number "4"))))
 """
 
-content = [
-    '(kicad_sch (version 20230121) (generator eeschema)',
-    f' (uuid "{gen_uuid()}")',
-    ' (paper "A3")',
-    ' (title_block (title "Edmund Fitzgerald - MASTER SCHEMATIC") (company "Project Edmund Fitzgerald") (rev "6.0") (date "2026-01-31"))',
-    ' (lib_symbols', symbols, ' )',
-    '',
-]
-
-# --- 1. INSTANTIATE ALL COMPONENTS ---
-u1_uuid = gen_uuid(); add_instance("U1", 1, "ESP32_Control", "", u1_uuid)
-content.append(f' (symbol (lib_id "MCU_Espressif:ESP32-DevKit") (at 150 100 0) (unit 1) (uuid "{u1_uuid}") (in_bom yes) (on_board yes) (fields_autoplaced yes) (property "Reference" "U1" (at 150 75 0)) (property "Value" "ESP32_Control" (at 150 125 0)))')
-
-q1_uuid = gen_uuid(); add_instance("Q1", 1, "MOSFET_N", "", q1_uuid)
-r1_uuid = gen_uuid(); add_instance("R1", 1, "100", "", r1_uuid)
-r2_uuid = gen_uuid(); add_instance("R2", 1, "10k", "", r2_uuid)
-d1_uuid = gen_uuid(); add_instance("D1", 1, "Running_Light", "", d1_uuid)
-content.extend([
-    f' (symbol (lib_id "Transistor_FET:Q_NMOS_GDS") (at 210 97.46 0) (unit 1) (uuid "{q1_uuid}") (in_bom yes) (on_board yes) (property "Reference" "Q1" (at 218 92 0)) (property "Value" "MOSFET_N" (at 218 97 0)))',
-    f' (symbol (lib_id "Device:R") (at 190 97.46 90) (unit 1) (uuid "{r1_uuid}") (in_bom yes) (on_board yes) (property "Reference" "R1" (at 190 92 0)) (property "Value" "100" (at 190 103 0)))',
-    f' (symbol (lib_id "Device:R") (at 210 110 0) (unit 1) (uuid "{r2_uuid}") (in_bom yes) (on_board yes) (property "Reference" "R2" (at 215 110 0)) (property "Value" "10k" (at 215 115 0)))',
-    f' (symbol (lib_id "Device:LED") (at 213.81 80 90) (unit 1) (uuid "{d1_uuid}") (in_bom yes) (on_board yes) (property "Reference" "D1" (at 213.81 75 0)) (property "Value" "Running_Light" (at 213.81 85 0)))',
-])
-
-q2_uuid = gen_uuid(); add_instance("Q2", 1, "MOSFET_N", "", q2_uuid)
-r5_uuid = gen_uuid(); add_instance("R5", 1, "100", "", r5_uuid)
-r6_uuid = gen_uuid(); add_instance("R6", 1, "10k", "", r6_uuid)
-d2_uuid = gen_uuid(); add_instance("D2", 1, "Flood_Light", "", d2_uuid)
-content.extend([
-    f' (symbol (lib_id "Transistor_FET:Q_NMOS_GDS") (at 210 147.46 0) (unit 1) (uuid "{q2_uuid}") (in_bom yes) (on_board yes) (property "Reference" "Q2" (at 218 142 0)) (property "Value" "MOSFET_N" (at 218 147 0)))',
-    f' (symbol (lib_id "Device:R") (at 190 147.46 90) (unit 1) (uuid "{r5_uuid}") (in_bom yes) (on_board yes) (property "Reference" "R5" (at 190 142 0)) (property "Value" "100" (at 190 153 0)))',
-    f' (symbol (lib_id "Device:R") (at 210 160 0) (unit 1) (uuid "{r6_uuid}") (in_bom yes) (on_board yes) (property "Reference" "R6" (at 215 160 0)) (property "Value" "10k" (at 215 165 0)))',
-    f' (symbol (lib_id "Device:LED") (at 213.81 130 90) (unit 1) (uuid "{d2_uuid}") (in_bom yes) (on_board yes) (property "Reference" "D2" (at 213.81 125 0)) (property "Value" "Flood_Light" (at 213.81 135 0)))',
-])
-
-r3_uuid = gen_uuid(); add_instance("R3", 1, "100k", "", r3_uuid)
-r4_uuid = gen_uuid(); add_instance("R4", 1, "47k", "", r4_uuid)
-content.extend([
-    f' (symbol (lib_id "Device:R") (at 100 94.92 90) (unit 1) (uuid "{r3_uuid}") (in_bom yes) (on_board yes) (property "Reference" "R3" (at 100 89 0)) (property "Value" "100k" (at 100 100 0)))',
-    f' (symbol (lib_id "Device:R") (at 110 110 0) (unit 1) (uuid "{r4_uuid}") (in_bom yes) (on_board yes) (property "Reference" "R4" (at 115 110 0)) (property "Value" "47k" (at 115 115 0)))',
-])
-
-u2_uuid = gen_uuid(); add_instance("U2", 1, "MAX98357A", "", u2_uuid)
-content.append(f' (symbol (lib_id "Module:MAX98357A") (at 260 140 0) (unit 1) (uuid "{u2_uuid}") (in_bom yes) (on_board yes) (property "Reference" "U2" (at 260 125 0)) (property "Value" "MAX98357A" (at 260 155 0)))')
-u3_uuid = gen_uuid(); add_instance("U3", 1, "DFPlayer_Pro", "", u3_uuid)
-content.append(f' (symbol (lib_id "Module:DFPlayer_Pro") (at 260 200 0) (unit 1) (uuid "{u3_uuid}") (in_bom yes) (on_board yes) (property "Reference" "U3" (at 260 180 0)) (property "Value" "DFPlayer_Pro" (at 260 220 0)))')
-
-j1_uuid = gen_uuid(); add_instance("J1", 1, "RC_Receiver", "", j1_uuid)
-content.append(f' (symbol (lib_id "Connector:Conn_01x03_Male") (at 80 150 0) (unit 1) (uuid "{j1_uuid}") (in_bom yes) (on_board yes) (property "Reference" "J1" (at 80 142 0)) (property "Value" "RC_Receiver" (at 80 158 0)))')
-m1_uuid = gen_uuid(); add_instance("M1", 1, "Rudder_Servo", "", m1_uuid)
-content.append(f' (symbol (lib_id "Motor:Servo") (at 80 180 0) (unit 1) (uuid "{m1_uuid}") (in_bom yes) (on_board yes) (property "Reference" "M1" (at 80 172 0)) (property "Value" "Rudder_Servo" (at 80 188 0)))')
-
-j3_uuid = gen_uuid(); add_instance("J3", 1, "Battery_LiPo", "", j3_uuid)
-content.append(f' (symbol (lib_id "Connector:Conn_01x02_Male") (at 10 250 0) (unit 1) (uuid "{j3_uuid}") (in_bom yes) (on_board yes) (property "Reference" "J3" (at 10 242 0)) (property "Value" "Battery_LiPo" (at 10 258 0)))')
-u5_uuid = gen_uuid(); add_instance("U5", 1, "UBEC_5V_Converter", "", u5_uuid)
-content.append(f' (symbol (lib_id "Converter_DCDC:UBEC_5V") (at 60 250 0) (unit 1) (uuid "{u5_uuid}") (in_bom yes) (on_board yes) (property "Reference" "U5" (at 60 240 0)) (property "Value" "UBEC_5V_3A" (at 60 260 0)))')
-
-u4_uuid = gen_uuid(); add_instance("U4", 1, "ESP32-CAM", "", u4_uuid)
-content.append(f' (symbol (lib_id "Module:ESP32-CAM") (at 260 260 0) (unit 1) (uuid "{u4_uuid}") (in_bom yes) (on_board yes) (property "Reference" "U4" (at 260 245 0)) (property "Value" "ESP32-CAM" (at 260 275 0)))')
+# The literals above open with a stray newline so the triple quotes read
+# cleanly; strip that once here at import so the emitted file carries no
+# blank filler lines inside lib_symbols.
+symbols = '\n'.join(s.strip('\n') for s in (
+    RESISTOR_SYMBOL, NMOS_SYMBOL, LED_SYMBOL, ESP32_DEVKIT_SYMBOL,
+    MAX98357A_SYMBOL, DFPLAYER_SYMBOL, ESP32_CAM_SYMBOL, CONN_1X03_SYMBOL,
+    CONN_1X02_SYMBOL, SERVO_SYMBOL, UBEC_SYMBOL))
+
+# The fixed framing is one pre-built template formatted in a single %-op;
+# only the sheet UUID and the symbol library get spliced in.
+_HEADER_TPL = '''(kicad_sch (version 20230121) (generator eeschema)
+ (uuid "%s")
+ (paper "A3")
+ (title_block (title "%s") (company "Project Edmund Fitzgerald") (rev "%s") (date "2026-01-31"))
+ (lib_symbols
+%s
+ )
+'''
 
 # --- 2. PHYSICAL WIRING & CONNECTIONS ---
-# Power System: Battery -> UBEC -> ESP32 & Modules
-content.extend(kicad_orthogonal_wire(4.92, 247.46, 47.3, 244.92, 25))    # Battery+ to UBEC
-content.extend(kicad_orthogonal_wire(4.92, 250.00, 47.3, 255.08, 30))    # Battery- to UBEC
-content.extend(kicad_orthogonal_wire(25, 244.92, 96.19, 94.92, 40))      # Tap Battery to Sensor
-content.extend(kicad_orthogonal_wire(72.7, 244.92, 134.76, 82.22, 100))  # UBEC 5V Output to ESP32 VIN (Pin 1)
-content.extend(kicad_orthogonal_wire(72.7, 255.08, 150, 122.86, 120))    # UBEC GND to ESP32 GND (Pin 15)
-
-# RC Interface (Orthogonal Wiring)
-content.extend(kicad_orthogonal_wire(74.92, 144.92, 165.24, 105.08, 90)) # Throttle to ESP
-content.extend(kicad_orthogonal_wire(74.92, 147.46, 165.24, 107.62, 92)) # Servo to ESP
-content.extend(kicad_orthogonal_wire(74.92, 147.46, 74.92, 177.46, 70))  # Tap to Rudder Servo
-
-# RC & Servo Power (From UBEC 5V Rail)
-content.extend(kicad_orthogonal_wire(72.7, 244.92, 74.92, 150, 72.7))    # J1 Power
-content.extend(kicad_orthogonal_wire(72.7, 244.92, 74.92, 180, 72.7))    # M1 Power
-content.extend(kicad_orthogonal_wire(72.7, 255.08, 74.92, 152.54, 72.7)) # J1 GND
-content.extend(kicad_orthogonal_wire(72.7, 255.08, 74.92, 182.54, 72.7)) # M1 GND
-
-# ESP32 Lighting Output
-content.extend([
-    kicad_wire(165.24, 97.46, 186.19, 97.46), kicad_wire(193.81, 97.46, 210, 97.46),
-    kicad_wire(210, 97.46, 210, 106.19), kicad_wire(210, 113.81, 210, 120),
-    kicad_wire(213.81, 92.38, 213.81, 83.81), kicad_wire(213.81, 76.19, 213.81, 70),
-    kicad_wire(213.81, 102.54, 213.81, 120),
-    kicad_wire(165.24, 110.16, 186.19, 147.46), kicad_wire(193.81, 147.46, 210, 147.46),
-    kicad_wire(210, 147.46, 210, 156.19), kicad_wire(210, 163.81, 210, 170),
-    kicad_wire(213.81, 142.38, 213.81, 133.81), kicad_wire(213.81, 126.19, 213.81, 120),
-    kicad_wire(213.81, 152.54, 213.81, 170),
-])
-
-# ESP32 Battery & Water Sensors
-content.extend([
-    kicad_wire(134.76, 94.92, 103.81, 94.92), kicad_wire(96.19, 94.92, 85, 94.92),
-    kicad_wire(103.81, 94.92, 110, 94.92), kicad_wire(110, 94.92, 110, 106.19),
-    kicad_wire(110, 113.81, 110, 120),
-    kicad_wire(134.76, 100, 110, 100), kicad_label("WATER_SENSOR", 110, 100),
-])
-
-# Audio Subsystem (Orthogonal Wiring)
-content.extend(kicad_orthogonal_wire(134.76, 105.08, 247.3, 134.92, 140)) # BCLK
-content.extend(kicad_orthogonal_wire(165.24, 112.7, 247.3, 137.46, 240))  # LRC
-content.extend(kicad_orthogonal_wire(165.24, 115.24, 247.3, 140.00, 242)) # DIN
-content.extend(kicad_orthogonal_wire(134.76, 107.62, 247.3, 192.38, 142)) # DFP RX
-content.extend(kicad_orthogonal_wire(134.76, 110.16, 247.3, 194.92, 144)) # DFP TX
-
-# Power Labels for modules
-content.extend([
-    kicad_label("8.4V_BATT", 213.81, 70, 90), kicad_label("GND", 210, 120, 90), 
-    kicad_label("8.4V_BATT", 213.81, 120, 90), kicad_label("GND", 210, 170, 90),
-    kicad_label("8.4V_BATT", 85, 94.92), kicad_label("GND", 110, 120, 90),
-    kicad_label("5V_POWER", 240, 129.84), kicad_label("GND", 240, 132.38),
-    kicad_label("5V_POWER", 240, 187.3), kicad_label("GND", 240, 189.84),
-    kicad_label("5V_POWER", 240, 250), kicad_label("GND", 240, 252.54),
-])
-
-# --- 3. FINALIZE ---
-content.append(' (sheet_instances (path "/" (page "1")))')
-content.append(' (symbol_instances')
-for inst in instances:
-    content.append(f'  (path "/{inst["uuid"]}" (reference "{inst["ref"]}") (unit {inst["unit"]}) (value "{inst["value"]}") (footprint "{inst["footprint"]}"))')
-content.append(' )')
-content.append(')')
-
-with open('/Users/ryanmioduskiimac/Documents/GitHub/EdmundFitzgeraldController/docs/schematics/Edmund_Fitzgerald_Telemetry.kicad_sch', 'w') as f:
-    f.write('\n'.join(content))
-print("KiCAD Master Schematic Updated - Fixed ESP32 VIN/GND and physical UBEC wiring.")
+# Geometry lives in flat record tables, one per element kind; a single loop
+# formats each table below, so adding a connection is a data row rather than
+# another call site.
+
+# (x1, y1, x2, y2, mid_x): L-shaped runs routed via mid_x
+ORTHOGONAL_WIRES = (
+    # Power System: Battery -> UBEC -> ESP32 & Modules
+    (4.92, 247.46, 47.3, 244.92, 25),      # Battery+ to UBEC
+    (4.92, 250.00, 47.3, 255.08, 30),      # Battery- to UBEC
+    (25, 244.92, 96.19, 94.92, 40),        # Tap Battery to Sensor
+    (72.7, 244.92, 134.76, 82.22, 100),    # UBEC 5V Output to ESP32 VIN (Pin 1)
+    (72.7, 255.08, 150, 122.86, 120),      # UBEC GND to ESP32 GND (Pin 15)
+    # RC Interface
+    (74.92, 144.92, 165.24, 105.08, 90),   # Throttle to ESP
+    (74.92, 147.46, 165.24, 107.62, 92),   # Servo to ESP
+    (74.92, 147.46, 74.92, 177.46, 70),    # Tap to Rudder Servo
+    # RC & Servo Power (From UBEC 5V Rail)
+    (72.7, 244.92, 74.92, 150, 72.7),      # J1 Power
+    (72.7, 244.92, 74.92, 180, 72.7),      # M1 Power
+    (72.7, 255.08, 74.92, 152.54, 72.7),   # J1 GND
+    (72.7, 255.08, 74.92, 182.54, 72.7),   # M1 GND
+    # Audio Subsystem
+    (134.76, 105.08, 247.3, 134.92, 140),  # BCLK
+    (165.24, 112.7, 247.3, 137.46, 240),   # LRC
+    (165.24, 115.24, 247.3, 140.00, 242),  # DIN
+    (134.76, 107.62, 247.3, 192.38, 142),  # DFP RX
+    (134.76, 110.16, 247.3, 194.92, 144),  # DFP TX
+)
+
+# (x1, y1, x2, y2): straight segments
+WIRES = (
+    # ESP32 Lighting Output
+    (165.24, 97.46, 186.19, 97.46), (193.81, 97.46, 210, 97.46),
+    (210, 97.46, 210, 106.19), (210, 113.81, 210, 120),
+    (213.81, 92.38, 213.81, 83.81), (213.81, 76.19, 213.81, 70),
+    (213.81, 102.54, 213.81, 120),
+    (165.24, 110.16, 186.19, 147.46), (193.81, 147.46, 210, 147.46),
+    (210, 147.46, 210, 156.19), (210, 163.81, 210, 170),
+    (213.81, 142.38, 213.81, 133.81), (213.81, 126.19, 213.81, 120),
+    (213.81, 152.54, 213.81, 170),
+    # ESP32 Battery & Water Sensors
+    (134.76, 94.92, 103.81, 94.92), (96.19, 94.92, 85, 94.92),
+    (103.81, 94.92, 110, 94.92), (110, 94.92, 110, 106.19),
+    (110, 113.81, 110, 120),
+    (134.76, 100, 110, 100),
+)
+
+# (text, x, y, rot)
+LABELS = (
+    ("WATER_SENSOR", 110, 100, 0),
+    # Power Labels for modules
+    ("8.4V_BATT", 213.81, 70, 90), ("GND", 210, 120, 90),
+    ("8.4V_BATT", 213.81, 120, 90), ("GND", 210, 170, 90),
+    ("8.4V_BATT", 85, 94.92, 0), ("GND", 110, 120, 90),
+    ("5V_POWER", 240, 129.84, 0), ("GND", 240, 132.38, 0),
+    ("5V_POWER", 240, 187.3, 0), ("GND", 240, 189.84, 0),
+    ("5V_POWER", 240, 250, 0), ("GND", 240, 252.54, 0),
+)
+
+_INSTANCE_TPL = '  (path "/%s" (reference "%s") (unit %s) (value "%s") (footprint "%s"))'
+
+def build_schematic():
+    """Assemble the schematic as a flat list of S-expression chunks."""
+    # Bind the hot helpers as locals: the loops below then hit LOAD_FAST
+    # instead of a global dict lookup per generated line.
+    _uuid = gen_uuid
+    _wire = kicad_wire
+    _label = kicad_label
+    _orth_wire = kicad_orthogonal_wire
+
+    content = [_HEADER_TPL % (_uuid(), SCHEMATIC_TITLE, SCHEMATIC_REV, symbols)]
+
+    # --- 1. INSTANTIATE ALL COMPONENTS ---
+    u1_uuid = _uuid(); add_instance("U1", 1, "ESP32_Control", "", u1_uuid)
+    content.append(f' (symbol (lib_id "MCU_Espressif:ESP32-DevKit") (at 150 100 0) (unit 1) (uuid "{u1_uuid}") (in_bom yes) (on_board yes) (fields_autoplaced yes) (property "Reference" "U1" (at 150 75 0)) (property "Value" "ESP32_Control" (at 150 125 0)))')
+
+    q1_uuid = _uuid(); add_instance("Q1", 1, "MOSFET_N", "", q1_uuid)
+    r1_uuid = _uuid(); add_instance("R1", 1, "100", "", r1_uuid)
+    r2_uuid = _uuid(); add_instance("R2", 1, "10k", "", r2_uuid)
+    d1_uuid = _uuid(); add_instance("D1", 1, "Running_Light", "", d1_uuid)
+    content.extend([
+        f' (symbol (lib_id "Transistor_FET:Q_NMOS_GDS") (at 210 97.46 0) (unit 1) (uuid "{q1_uuid}") (in_bom yes) (on_board yes) (property "Reference" "Q1" (at 218 92 0)) (property "Value" "MOSFET_N" (at 218 97 0)))',
+        f' (symbol (lib_id "Device:R") (at 190 97.46 90) (unit 1) (uuid "{r1_uuid}") (in_bom yes) (on_board yes) (property "Reference" "R1" (at 190 92 0)) (property "Value" "100" (at 190 103 0)))',
+        f' (symbol (lib_id "Device:R") (at 210 110 0) (unit 1) (uuid "{r2_uuid}") (in_bom yes) (on_board yes) (property "Reference" "R2" (at 215 110 0)) (property "Value" "10k" (at 215 115 0)))',
+        f' (symbol (lib_id "Device:LED") (at 213.81 80 90) (unit 1) (uuid "{d1_uuid}") (in_bom yes) (on_board yes) (property "Reference" "D1" (at 213.81 75 0)) (property "Value" "Running_Light" (at 213.81 85 0)))',
+    ])
+
+    q2_uuid = _uuid(); add_instance("Q2", 1, "MOSFET_N", "", q2_uuid)
+    r5_uuid = _uuid(); add_instance("R5", 1, "100", "", r5_uuid)
+    r6_uuid = _uuid(); add_instance("R6", 1, "10k", "", r6_uuid)
+    d2_uuid = _uuid(); add_instance("D2", 1, "Flood_Light", "", d2_uuid)
+    content.extend([
+        f' (symbol (lib_id "Transistor_FET:Q_NMOS_GDS") (at 210 147.46 0) (unit 1) (uuid "{q2_uuid}") (in_bom yes) (on_board yes) (property "Reference" "Q2" (at 218 142 0)) (property "Value" "MOSFET_N" (at 218 147 0)))',
+        f' (symbol (lib_id "Device:R") (at 190 147.46 90) (unit 1) (uuid "{r5_uuid}") (in_bom yes) (on_board yes) (property "Reference" "R5" (at 190 142 0)) (property "Value" "100" (at 190 153 0)))',
+        f' (symbol (lib_id "Device:R") (at 210 160 0) (unit 1) (uuid "{r6_uuid}") (in_bom yes) (on_board yes) (property "Reference" "R6" (at 215 160 0)) (property "Value" "10k" (at 215 165 0)))',
+        f' (symbol (lib_id "Device:LED") (at 213.81 130 90) (unit 1) (uuid "{d2_uuid}") (in_bom yes) (on_board yes) (property "Reference" "D2" (at 213.81 125 0)) (property "Value" "Flood_Light" (at 213.81 135 0)))',
+    ])
+
+    r3_uuid = _uuid(); add_instance("R3", 1, "100k", "", r3_uuid)
+    r4_uuid = _uuid(); add_instance("R4", 1, "47k", "", r4_uuid)
+    content.extend([
+        f' (symbol (lib_id "Device:R") (at 100 94.92 90) (unit 1) (uuid "{r3_uuid}") (in_bom yes) (on_board yes) (property "Reference" "R3" (at 100 89 0)) (property "Value" "100k" (at 100 100 0)))',
+        f' (symbol (lib_id "Device:R") (at 110 110 0) (unit 1) (uuid "{r4_uuid}") (in_bom yes) (on_board yes) (property "Reference" "R4" (at 115 110 0)) (property "Value" "47k" (at 115 115 0)))',
+    ])
+
+    u2_uuid = _uuid(); add_instance("U2", 1, "MAX98357A", "", u2_uuid)
+    content.append(f' (symbol (lib_id "Module:MAX98357A") (at 260 140 0) (unit 1) (uuid "{u2_uuid}") (in_bom yes) (on_board yes) (property "Reference" "U2" (at 260 125 0)) (property "Value" "MAX98357A" (at 260 155 0)))')
+    u3_uuid = _uuid(); add_instance("U3", 1, "DFPlayer_Pro", "", u3_uuid)
+    content.append(f' (symbol (lib_id "Module:DFPlayer_Pro") (at 260 200 0) (unit 1) (uuid "{u3_uuid}") (in_bom yes) (on_board yes) (property "Reference" "U3" (at 260 180 0)) (property "Value" "DFPlayer_Pro" (at 260 220 0)))')
+
+    j1_uuid = _uuid(); add_instance("J1", 1, "RC_Receiver", "", j1_uuid)
+    content.append(f' (symbol (lib_id "Connector:Conn_01x03_Male") (at 80 150 0) (unit 1) (uuid "{j1_uuid}") (in_bom yes) (on_board yes) (property "Reference" "J1" (at 80 142 0)) (property "Value" "RC_Receiver" (at 80 158 0)))')
+    m1_uuid = _uuid(); add_instance("M1", 1, "Rudder_Servo", "", m1_uuid)
+    content.append(f' (symbol (lib_id "Motor:Servo") (at 80 180 0) (unit 1) (uuid "{m1_uuid}") (in_bom yes) (on_board yes) (property "Reference" "M1" (at 80 172 0)) (property "Value" "Rudder_Servo" (at 80 188 0)))')
+
+    j3_uuid = _uuid(); add_instance("J3", 1, "Battery_LiPo", "", j3_uuid)
+    content.append(f' (symbol (lib_id "Connector:Conn_01x02_Male") (at 10 250 0) (unit 1) (uuid "{j3_uuid}") (in_bom yes) (on_board yes) (property "Reference" "J3" (at 10 242 0)) (property "Value" "Battery_LiPo" (at 10 258 0)))')
+    u5_uuid = _uuid(); add_instance("U5", 1, "UBEC_5V_Converter", "", u5_uuid)
+    content.append(f' (symbol (lib_id "Converter_DCDC:UBEC_5V") (at 60 250 0) (unit 1) (uuid "{u5_uuid}") (in_bom yes) (on_board yes) (property "Reference" "U5" (at 60 240 0)) (property "Value" "UBEC_5V_3A" (at 60 260 0)))')
+
+    u4_uuid = _uuid(); add_instance("U4", 1, "ESP32-CAM", "", u4_uuid)
+    content.append(f' (symbol (lib_id "Module:ESP32-CAM") (at 260 260 0) (unit 1) (uuid "{u4_uuid}") (in_bom yes) (on_board yes) (property "Reference" "U4" (at 260 245 0)) (property "Value" "ESP32-CAM" (at 260 275 0)))')
+
+    for w in ORTHOGONAL_WIRES:
+        content.extend(_orth_wire(*w))
+    for w in WIRES:
+        content.append(_wire(*w))
+    for lab in LABELS:
+        content.append(_label(*lab))
+
+    # --- 3. FINALIZE ---
+
+    content.append(' (sheet_instances (path "/" (page "1")))\n (symbol_instances')
+    for inst in instances:
+        content.append(_INSTANCE_TPL % (inst["uuid"], inst["ref"], inst["unit"], inst["value"], inst["footprint"]))
+    content.append(' )\n)')
+
+    return content
+
+content = build_schematic()
+
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'docs', 'schematics', 'Edmund_Fitzgerald_Telemetry.kicad_sch')
+
+# Embed each chunk's trailing newline up front so the empty-separator join
+# skips CPython's separator accounting, then encode the result in one pass
+# and hand the kernel a single write.
+data = ''.join([chunk + '\n' for chunk in content]).encode('utf-8')
+# Idempotent write: when the on-disk schematic already matches, skip the
+# rewrite so mtime (and anything watching it) stays untouched. Only a no-op
+# with deterministic UUIDs, but the comparison costs one ~10 KB read.
+try:
+    with open(OUTPUT_PATH, 'rb') as f:
+        unchanged = f.read() == data
+except FileNotFoundError:
+    unchanged = False
+
+if unchanged:
+    print("KiCAD Master Schematic unchanged - write skipped.")
+else:
+    fd = os.open(OUTPUT_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    print("KiCAD Master Schematic Updated - Fixed ESP32 VIN/GND and physical UBEC wiring.")